@@ -1,7 +1,7 @@
 import csv
 import sys
 
-from util import Node, StackFrontier, QueueFrontier
+from util import Node, QueueFrontier
 
 # Maps names to a set of corresponding person_ids
 names = {}
@@ -92,7 +92,9 @@ def shortest_path(source, target):
     If no possible path, returns None.
     """
 
-    existing_nodes = set()
+    # People already reached; a person found again through a different
+    # movie can't lead to a shorter path, so they are only enqueued once
+    existing_nodes = {source}
     empty_node = Node(state=None, parent=None, action=None)
     source_node = Node(state=source, parent=empty_node, action=None)
     frontier = QueueFrontier()
@@ -101,15 +103,7 @@ def shortest_path(source, target):
     while frontier.empty() == False:
         node = frontier.remove()
         if node.state == target:
-            print("found target")
-            path_to_return = []
-            while node.parent.state != None:
-                path_to_return.append((node.action, node.state))
-                node = node.parent
-
-            path_to_return.reverse()
-            print(path_to_return)
-            return path_to_return
+            return path_to_node(node)
 
         # Debugging
         # name = people[node.state]["name"]
@@ -121,13 +115,29 @@ def shortest_path(source, target):
         for movie in movies_this_source_is_in:
             actors_in_this_movie = movies[movie]["stars"]
             for actor in actors_in_this_movie:
-                if actor != source and concat_strings(actor, movie) not in existing_nodes:
+                if actor not in existing_nodes:
                     new_node = Node(state=actor, parent=node, action=movie)
-                    existing_nodes.add(concat_strings(actor, movie))
+                    # Goal test on generation: stop as soon as the target is
+                    # discovered rather than expanding the rest of this layer
+                    if actor == target:
+                        return path_to_node(new_node)
+                    existing_nodes.add(actor)
                     frontier.add(new_node)
 
-def concat_strings(string1, string2):
-    return string1 + string2
+
+def path_to_node(node):
+    """
+    Walks parent pointers back from node and returns the
+    list of (movie_id, person_id) pairs leading to it.
+    """
+    path_to_return = []
+    while node.parent.state != None:
+        path_to_return.append((node.action, node.state))
+        node = node.parent
+
+    path_to_return.reverse()
+    return path_to_return
+
 
 def person_id_for_name(name):
     """